@@ -1,12 +1,13 @@
-import os
 from datetime import datetime
+from pathlib import Path
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
-from utils.config import config
+from utils.config import load_config
 
 # -----------------------------------------------------------------------------
 # 1. Application Configuration
@@ -21,45 +22,63 @@ st.set_page_config(
 # -----------------------------------------------------------------------------
 # 2. Data Access Layer
 # -----------------------------------------------------------------------------
-@st.cache_data
-def load_dataset() -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+def _file_version(path: Path) -> Tuple[str, Optional[float]]:
+    """Cache key for a data file: its path plus modification time (None if missing)."""
+    return str(path), path.stat().st_mtime if path.exists() else None
+
+
+@st.cache_data(ttl=600, show_spinner=False, hash_funcs={Path: _file_version})
+def load_dataset(data_path: Path) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     """
     Load and preprocess the processed dataset from the local file system.
 
     Decorators:
         @st.cache_data: Caches the result to optimize performance on re-runs.
-                        Cache is invalidated when the underlying file changes.
+                        Cache is keyed on the file's mtime, so it is invalidated
+                        when the ETL rewrites the file, and expires after 10 minutes.
+
+    Args:
+        data_path (Path): Location of the processed Parquet file.
 
     Returns:
         Tuple[Optional[pd.DataFrame], Optional[str]]:
-            - Preprocessed DataFrame (None if file missing).
+            - Preprocessed DataFrame sorted by LP ascending (None if file missing).
             - Last modification timestamp string (None if file missing).
     """
-    data_path = config["path"]["processed_data"]
-
-    if not os.path.exists(data_path):
+    if not data_path.exists():
         return None, None
 
     # Metadata: File modification time
-    mod_time = os.path.getmtime(data_path)
+    mod_time = data_path.stat().st_mtime
     last_updated = datetime.fromtimestamp(mod_time).strftime("%Y-%m-%d %H:%M:%S")
 
     # Load Data
-    df = pd.read_csv(data_path)
-
-    # Feature Engineering for Dashboard
-    # Calculation: Win Rate (%) and Total Games
-    df["win_rate"] = (df["wins"] / (df["wins"] + df["losses"]) * 100).round(1)
-    df["total_games"] = df["wins"] + df["losses"]
+    # win_rate / total_games are precomputed by the ETL; only plotted columns are read
+    df = pd.read_parquet(
+        data_path, columns=["lp", "wins", "losses", "win_rate", "total_games"]
+    ).rename(columns={"lp": "leaguePoints"})
+
+    # Memory: Narrow dtypes before caching (LP, game counts stay far below 2^16)
+    df = df.astype(
+        {
+            "leaguePoints": "int32",
+            "wins": "uint16",
+            "losses": "uint16",
+            "total_games": "uint16",
+            "win_rate": "float32",
+        }
+    )
 
-    # Data Cleaning: Remove outliers where win rate > 100%
-    df = df[df["win_rate"] <= 100]
+    # Sort once by LP so slider filtering is a binary search instead of a mask
+    df = df.sort_values("leaguePoints", ascending=True, kind="mergesort").reset_index(
+        drop=True
+    )
 
     return df, last_updated
 
 
 # Load data into memory
-df, last_updated = load_dataset()
+df, last_updated = load_dataset(Path(load_config()["path"]["processed_data"]))
 
 # -----------------------------------------------------------------------------
 # 3. Sidebar: Global Filters & Metadata
@@ -70,13 +89,15 @@ with st.sidebar:
     if df is not None:
         st.subheader("Filter Settings")
 
-        # LP Filter
-        min_lp = int(df["leaguePoints"].min())
-        max_lp = int(df["leaguePoints"].max())
+        # LP Filter (df is sorted ascending by LP)
+        lp_array = df["leaguePoints"].to_numpy()
+        min_lp = int(lp_array[0])
+        max_lp = int(lp_array[-1])
         target_lp = st.slider("Minimum League Points", min_lp, max_lp, min_lp)
 
-        # Apply Filter
-        filtered_df = df[df["leaguePoints"] >= target_lp]
+        # Apply Filter: O(log n) lookup + row slice instead of a full boolean mask
+        idx = np.searchsorted(lp_array, target_lp, side="left")
+        filtered_df = df.iloc[idx:]
 
         st.markdown("---")
         st.markdown(f"**Selected Users:** {len(filtered_df):,}")
@@ -107,16 +128,21 @@ if df is not None:
     # 4.2. Key Performance Indicators (KPIs)
     kpi1, kpi2, kpi3, kpi4 = st.columns(4)
 
+    # Single aggregation call for all KPI reductions
+    stats = filtered_df.agg(
+        {"leaguePoints": "mean", "win_rate": "mean", "total_games": "max"}
+    )
+
     with kpi1:
         st.metric(label="Analyzed Players", value=f"{len(filtered_df):,}")
     with kpi2:
-        avg_lp = int(filtered_df["leaguePoints"].mean())
+        avg_lp = int(stats["leaguePoints"])
         st.metric(label="Average LP", value=f"{avg_lp:,}")
     with kpi3:
-        avg_wr = filtered_df["win_rate"].mean()
+        avg_wr = stats["win_rate"]
         st.metric(label="Average Win Rate", value=f"{avg_wr:.1f}%")
     with kpi4:
-        max_games = filtered_df["total_games"].max()
+        max_games = int(stats["total_games"])
         st.metric(label="Max Games Played", value=f"{max_games}")
 
     st.divider()
@@ -127,33 +153,52 @@ if df is not None:
     with col_chart_1:
         st.subheader("Correlation: LP vs. Win Rate")
         # Scatter Plot: Visualizes relationship between ranking score and win efficiency
-        fig_scatter = px.scatter(
-            filtered_df,
-            x="leaguePoints",
-            y="win_rate",
-            size="total_games",
-            color="win_rate",
-            color_continuous_scale="Viridis",  # Professional color scale
-            opacity=0.7,
-            labels={"leaguePoints": "League Points (LP)", "win_rate": "Win Rate (%)"},
+        # WebGL trace fed with plain arrays keeps the payload a fixed-schema dict
+        fig_scatter = go.Figure(
+            go.Scattergl(
+                x=filtered_df["leaguePoints"].to_numpy(),
+                y=filtered_df["win_rate"].to_numpy(),
+                mode="markers",
+                marker=dict(
+                    size=np.clip(filtered_df["total_games"].to_numpy() / 20, 4, 20),
+                    color=filtered_df["win_rate"].to_numpy(),
+                    colorscale="Viridis",  # Professional color scale
+                    showscale=True,
+                    opacity=0.7,
+                ),
+            )
+        )
+        fig_scatter.update_layout(
+            height=400,
+            margin=dict(l=20, r=20, t=30, b=20),
             template="plotly_white",  # Clean background
+            xaxis_title="League Points (LP)",
+            yaxis_title="Win Rate (%)",
+            uirevision="lp_wr",  # Keep zoom state across slider updates
         )
-        fig_scatter.update_layout(height=400, margin=dict(l=20, r=20, t=30, b=20))
         st.plotly_chart(fig_scatter, use_container_width=True)
 
     with col_chart_2:
         st.subheader("LP Distribution")
         # Histogram: Shows the density of players across LP ranges
-        fig_hist = px.histogram(
-            filtered_df,
-            x="leaguePoints",
-            nbins=20,
-            color_discrete_sequence=["#34495e"],  # Corporate Navy Blue
-            labels={"leaguePoints": "League Points (LP)"},
-            template="plotly_white",
+        # Bins are computed server-side so only O(bins) values reach the browser
+        counts, edges = np.histogram(filtered_df["leaguePoints"].to_numpy(), bins=20)
+        fig_hist = go.Figure(
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
+                marker_color="#34495e",  # Corporate Navy Blue
+            )
         )
         fig_hist.update_layout(
-            height=400, margin=dict(l=20, r=20, t=30, b=20), showlegend=False
+            height=400,
+            margin=dict(l=20, r=20, t=30, b=20),
+            showlegend=False,
+            bargap=0.02,
+            template="plotly_white",
+            xaxis_title="League Points (LP)",
+            yaxis_title="count",
         )
         st.plotly_chart(fig_hist, use_container_width=True)
 
@@ -162,15 +207,18 @@ if df is not None:
 
     # Prepare display dataframe
     display_cols = ["leaguePoints", "wins", "losses", "win_rate", "total_games"]
-    display_df = (
-        filtered_df[display_cols]
-        .sort_values(by="leaguePoints", ascending=False)
-        .head(50)
-    )
+    # filtered_df is already sorted by LP ascending, so top 50 is a reversed tail slice
+    display_df = filtered_df[display_cols].iloc[::-1].head(50).reset_index(drop=True)
 
     # Render interactive table
+    # Win rate is rendered client-side as a progress bar instead of a Styler gradient
     st.dataframe(
-        display_df.style.background_gradient(subset=["win_rate"], cmap="GnBu"),
+        display_df,
+        column_config={
+            "win_rate": st.column_config.ProgressColumn(
+                "win_rate", min_value=0, max_value=100, format="%.1f%%"
+            )
+        },
         use_container_width=True,
         height=400,
     )
@@ -181,6 +229,6 @@ else:
     st.markdown("""
         **Troubleshooting:**
         1. Verify that the ETL pipeline (`main.py`) has been executed successfully.
-        2. Check if `data/processed/cleaned_data.csv` exists.
+        2. Check if `data/processed/cleaned_data.parquet` exists.
         3. Review `logs/etl.log` for any upstream errors.
     """)
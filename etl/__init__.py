@@ -0,0 +1,21 @@
+"""
+Package: etl
+Description:
+    Extract, Transform and Load stages of the LoL Data Pipeline.
+    Loads the `.env` file once so every stage sees the same environment at import.
+"""
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class ExtractError(Exception):
+    """Raised when the Extract stage cannot obtain the raw payload."""
+
+
+class TransformError(ValueError):
+    """Raised when the Transform stage rejects or fails to process the payload."""
+
+
+class LoadError(Exception):
+    """Raised when the Load stage cannot persist data to the target database."""
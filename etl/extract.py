@@ -4,32 +4,162 @@ Description:
     Handles data ingestion from the Riot Games API.
     Implements reliability patterns including Exponential Backoff for rate limiting.
 """
-import json
 import logging
 import os
-import time
+from functools import lru_cache
 from typing import Any, Dict, List
 
+import orjson
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from etl import ExtractError
 
 logger = logging.getLogger(__name__)
-load_dotenv()
 
 API_KEY = os.getenv("RIOT_API_KEY")
 HEADERS = {"X-Riot-Token": API_KEY}
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Entry fields consumed downstream; everything else is dropped right after parsing
+ENTRY_FIELDS = ("summonerName", "summonerId", "leaguePoints", "wins", "losses")
+
+RAW_BACKUP_PATH = "data/raw/challenger_raw.json"
+RAW_META_PATH = "data/raw/challenger_raw.meta.json"
+
+
+@lru_cache(maxsize=None)
+def _get_session(retries: int, backoff_factor: int) -> requests.Session:
+    """
+    Builds a pooled HTTP session whose retry policy is delegated to urllib3.
+
+    Sessions are cached per retry policy so repeated extracts reuse the same
+    keep-alive connections instead of paying a TCP/TLS handshake per request.
 
+    Args:
+        retries (int): Maximum number of attempts, the first request included.
+        backoff_factor (int): Multiplier for sleep time between retries.
 
-def _save_raw_backup(data: Dict[str, Any]) -> None:
+    Returns:
+        requests.Session: Session with the Riot auth header and retry adapter mounted.
+    """
+    retry = Retry(
+        # urllib3 counts retries after the first attempt
+        total=max(retries - 1, 0),
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _save_raw_backup(data: Dict[str, Any], headers: Dict[str, str]) -> None:
     """
     Persists raw API response to local storage for debugging and backfill purposes.
 
+    The response validators (ETag / Last-Modified) are stored next to the backup
+    so the next extract can issue a conditional GET.
+
     Args:
         data (dict): The raw JSON payload received from the API.
+        headers (dict): Response headers of the request that produced the payload.
+    """
+    os.makedirs(os.path.dirname(RAW_BACKUP_PATH), exist_ok=True)
+    with open(RAW_BACKUP_PATH, "wb") as f:
+        f.write(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+
+    meta = {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+    }
+    with open(RAW_META_PATH, "wb") as f:
+        f.write(orjson.dumps(meta))
+
+
+def _conditional_headers() -> Dict[str, str]:
+    """
+    Builds If-None-Match / If-Modified-Since headers from the cached validators.
+
+    Returns:
+        dict: Conditional request headers (empty if no usable cache exists).
+    """
+    if not (os.path.exists(RAW_BACKUP_PATH) and os.path.exists(RAW_META_PATH)):
+        return {}
+
+    try:
+        with open(RAW_META_PATH, "rb") as f:
+            meta = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"[Extract] Ignoring unreadable cache metadata: {e}")
+        return {}
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _load_raw_backup() -> Dict[str, Any]:
+    """
+    Reads the cached raw payload from local storage.
+
+    Returns:
+        dict: The payload saved by the last successful (200) extract.
+    """
+    with open(RAW_BACKUP_PATH, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _project_entries(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Keeps only the entry fields used by the transform stage.
+
+    Missing fields are left out (not set to None) so the transform stage's
+    schema-drift handling still sees them as absent.
+
+    Args:
+        payload (dict): The raw league payload containing an `entries` list.
+
+    Returns:
+        List[Dict[str, Any]]: Slimmed-down player entries.
+    """
+    return [
+        {k: entry[k] for k in ENTRY_FIELDS if k in entry}
+        for entry in payload.get("entries", [])
+    ]
+
+
+def load_cached_entries() -> List[Dict[str, Any]]:
     """
-    os.makedirs("data/raw", exist_ok=True)
-    with open("data/raw/challenger_raw.json", "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+    Returns player entries from the last saved raw backup without calling the API.
+
+    Used when the Extract stage is skipped (see `ETL_SKIP_STAGES` in main.py).
+
+    Returns:
+        List[Dict[str, Any]]: A list of player entries (dictionaries).
+
+    Raises:
+        ExtractError: If no readable raw backup exists.
+    """
+    try:
+        entries = _project_entries(_load_raw_backup())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.error(f"[Extract] Raw backup unavailable: {e}")
+        raise ExtractError("RAW_BACKUP_MISSING") from e
+
+    logger.info(f"[Extract] Loaded {len(entries)} records from raw backup.")
+    return entries
 
 
 def extract_data(retries: int = 3, backoff_factor: int = 2) -> List[Dict[str, Any]]:
@@ -37,56 +167,61 @@ def extract_data(retries: int = 3, backoff_factor: int = 2) -> List[Dict[str, An
     Fetches Challenger League data from Riot API with fault tolerance.
 
     Implements an exponential backoff strategy to handle HTTP 429 (Rate Limit)
-    and transient network errors.
+    and transient server errors, honoring the Retry-After header sent by Riot.
 
     Args:
-        retries (int): Maximum number of retry attempts. Defaults to 3.
+        retries (int): Maximum number of attempts, the first request included.
+            Defaults to 3.
         backoff_factor (int): Multiplier for sleep time between retries. Defaults to 2.
 
     Returns:
         List[Dict[str, Any]]: A list of player entries (dictionaries).
 
     Raises:
-        ValueError: If RIOT_API_KEY is missing.
-        Exception: If API rate limit is exceeded after max retries.
+        ExtractError: If RIOT_API_KEY is missing, the API rate limit is still
+            exceeded after max retries, the request fails, the response cannot
+            be parsed, or the raw backup cannot be read or written.
     """
     if not API_KEY:
         logger.critical("[Config] Missing RIOT_API_KEY environment variable.")
-        raise ValueError("API_KEY_MISSING")
+        raise ExtractError("API_KEY_MISSING")
 
     target_url = "https://kr.api.riotgames.com/lol/league/v4/challengerleagues/by-queue/RANKED_SOLO_5x5"
 
-    for attempt in range(retries):
-        try:
-            # [Network] HTTP GET request with explicit timeout to prevent hanging
-            response = requests.get(target_url, headers=HEADERS, timeout=10)
-
-            if response.status_code == 200:
-                payload = response.json()
-                _save_raw_backup(payload)
-                logger.info(
-                    f"[Extract] Successfully fetched {len(payload.get('entries', []))} records."
-                )
-                return payload.get("entries", [])
-
-            elif response.status_code == 429:
-                # [Rate Limit] Apply Exponential Backoff (e.g., 2s -> 4s -> 8s)
-                wait_time = backoff_factor**attempt
-                logger.warning(
-                    f"[Extract] Rate limit hit. Retrying in {wait_time}s (Attempt {attempt+1}/{retries})."
-                )
-                time.sleep(wait_time)
-                continue
-
-            else:
-                response.raise_for_status()
-
-        except requests.exceptions.RequestException as e:
-            logger.error(
-                f"[Extract] Connection error (Attempt {attempt+1}/{retries}): {e}"
-            )
-            if attempt == retries - 1:
-                raise
-
-    logger.error("[Extract] Max retries exceeded.")
-    raise Exception("API_RATE_LIMIT_EXCEEDED")
+    session = _get_session(retries, backoff_factor)
+
+    try:
+        # [Network] Retries, backoff and Retry-After handling are done by urllib3
+        response = session.get(target_url, headers=_conditional_headers(), timeout=10)
+        response.raise_for_status()
+
+    except requests.exceptions.RetryError as e:
+        logger.error(f"[Extract] Max retries exceeded: {e}")
+        raise ExtractError("API_RATE_LIMIT_EXCEEDED") from e
+
+    except requests.exceptions.RequestException as e:
+        logger.error(f"[Extract] Connection error: {e}")
+        raise ExtractError("API_REQUEST_FAILED") from e
+
+    if response.status_code == 304:
+        # [Cache] Leaderboard unchanged since last run; reuse the local backup
+        logger.info("[Extract] Not modified since last fetch. Using raw backup.")
+        return load_cached_entries()
+
+    try:
+        payload = orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        logger.error(f"[Extract] Malformed API response: {e}")
+        raise ExtractError("API_RESPONSE_INVALID") from e
+
+    try:
+        _save_raw_backup(payload, response.headers)
+    except (OSError, TypeError) as e:
+        logger.error(f"[Extract] Failed to write raw backup: {e}")
+        raise ExtractError("RAW_BACKUP_WRITE_FAILED") from e
+
+    entries = _project_entries(payload)
+    del payload
+
+    logger.info(f"[Extract] Successfully fetched {len(entries)} records.")
+    return entries
@@ -4,31 +4,261 @@ Description:
     Manages data persistence to SQLite (Development) or PostgreSQL (Production).
     Implements Atomic Upsert strategy to ensure idempotency.
 """
+import io
 import logging
 import os
+from functools import lru_cache
 
 import pandas as pd
-from sqlalchemy import create_engine, text
+import psycopg2
+from psycopg2.extras import execute_values
+from sqlalchemy import Column, MetaData, Table, create_engine, event, text
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.types import Float, Integer, String
+
+from etl import LoadError
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import so every load in a process targets the same database
+_DB_URL = os.getenv("DB_URL") or "sqlite:///lol_data.db"
+_IS_SQLITE = "sqlite" in _DB_URL
+
+TARGET_TABLE = "challenger_stats"
+STAGING_TABLE = "temp_challenger_stats"
+UPSERT_COLUMNS = (
+    "player_name",
+    "summoner_id",
+    "lp",
+    "wins",
+    "losses",
+    "total_games",
+    "win_rate",
+)
+# Server-side prepared name of the staging -> target merge
+_UPSERT_STATEMENT = "upsert_challenger"
+# Rows encoded per COPY chunk (bounds the in-memory CSV buffer)
+COPY_CHUNK_ROWS = 10_000
+# Serves "ORDER BY lp DESC" leaderboard reads; the ETL does not pre-sort rows.
+# Recreated on every SQLite replace; PostgreSQL gets it once from sql/ schema setup.
+_LP_INDEX_DDL = (
+    f"CREATE INDEX IF NOT EXISTS {TARGET_TABLE}_lp_desc ON {TARGET_TABLE} (lp DESC)"
+)
+# Explicit column types of the SQLite replica (summoner_id stays VARCHAR)
+_SQL_DTYPES = {
+    "player_name": String(64),
+    "summoner_id": String(63),
+    "lp": Integer,
+    "wins": Integer,
+    "losses": Integer,
+    "total_games": Integer,
+    "win_rate": Float,
+}
+# VARCHAR columns whose empty strings must survive COPY as '' rather than NULL
+_TEXT_COLUMNS = tuple(
+    name for name, sql_type in _SQL_DTYPES.items() if isinstance(sql_type, String)
+)
+_SQLITE_TABLE = Table(
+    TARGET_TABLE,
+    MetaData(),
+    *(Column(name, sql_type) for name, sql_type in _SQL_DTYPES.items()),
+)
+# Batches smaller than this are upserted in a single statement without staging
+SMALL_BATCH_THRESHOLD = 5000
+
+_UPSERT_CONFLICT_CLAUSE = """
+    ON CONFLICT (summoner_id)
+    DO UPDATE SET
+        lp = EXCLUDED.lp,
+        wins = EXCLUDED.wins,
+        losses = EXCLUDED.losses,
+        total_games = EXCLUDED.total_games,
+        win_rate = EXCLUDED.win_rate,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+# Applied to every new SQLite connection: WAL lets readers run during writes,
+# synchronous=NORMAL skips the per-commit fsync and mmap avoids read() per page.
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=30000",
+)
+# Only meaningful for file-backed databases (skipped for :memory:)
+_SQLITE_FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA mmap_size=268435456",
+)
+
 
-def _get_engine():
+@lru_cache(maxsize=4)
+def _get_engine(db_url: str):
     """
     Constructs a SQLAlchemy engine with environment-specific configurations.
 
+    Engines are cached per URL so the connection pool survives across loads
+    instead of paying the connect/auth handshake on every call.
+
+    Args:
+        db_url (str): SQLAlchemy database URL.
+
     Returns:
         sqlalchemy.engine.Engine: Configured database engine.
     """
-    db_url = os.getenv("DB_URL", "sqlite:///lol_data.db")
 
-    # [Performance] SQLite optimization for high concurrency
+    # [Performance] SQLite optimization for high concurrency (WAL + tuned PRAGMAs)
     if "sqlite" in db_url:
-        return create_engine(
+        engine = create_engine(
             db_url, connect_args={"timeout": 30, "check_same_thread": False}
         )
-    return create_engine(db_url)
+
+        # In-memory databases have no journal file or pages to map
+        in_memory = ":memory:" in db_url or db_url.rstrip("/") == "sqlite:"
+        pragmas = (
+            _SQLITE_PRAGMAS if in_memory else _SQLITE_FILE_PRAGMAS + _SQLITE_PRAGMAS
+        )
+
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+            cursor = dbapi_conn.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+        return engine
+    return create_engine(db_url, pool_pre_ping=True, pool_size=5, max_overflow=10)
+
+
+def _copy_to_staging(conn, df: pd.DataFrame, staging_table: str) -> None:
+    """
+    Bulk-loads a DataFrame into a PostgreSQL table via `COPY FROM STDIN`.
+
+    Bypasses per-row parameter binding by streaming the frame as CSV through
+    psycopg2's COPY protocol on the connection's current transaction. Rows are
+    encoded and sent one chunk after another, so the CSV buffer never holds
+    more than one chunk (encoding does not overlap with sending).
+
+    Text columns are loaded with FORCE_NOT_NULL: `to_csv` writes an empty
+    string unquoted, which COPY would otherwise read as NULL, unlike the
+    `execute_values` path.
+
+    Args:
+        conn (sqlalchemy.engine.Connection): Open connection inside a transaction.
+        df (pd.DataFrame): Data to copy; column names must match the table.
+        staging_table (str): Destination table name.
+    """
+    text_columns = [col for col in _TEXT_COLUMNS if col in df.columns]
+    copy_sql = (
+        f"COPY {staging_table} ({', '.join(df.columns)}) FROM STDIN "
+        f"WITH (FORMAT csv, FORCE_NOT_NULL ({', '.join(text_columns)}))"
+        if text_columns
+        else f"COPY {staging_table} ({', '.join(df.columns)}) FROM STDIN WITH CSV"
+    )
+
+    cursor = conn.connection.cursor()
+    try:
+        for start in range(0, len(df), COPY_CHUNK_ROWS):
+            buf = io.StringIO()
+            df.iloc[start : start + COPY_CHUNK_ROWS].to_csv(
+                buf, index=False, header=False
+            )
+            buf.seek(0)
+            cursor.copy_expert(copy_sql, buf)
+    finally:
+        cursor.close()
+
+
+def _replace_sqlite(conn, df: pd.DataFrame) -> None:
+    """
+    Replaces the SQLite table contents with a single `executemany` insert.
+
+    Avoids pandas' to_sql scaffolding (dtype introspection, per-chunk statement
+    compilation); rows go straight from `itertuples` to the sqlite3 driver.
+
+    Args:
+        conn (sqlalchemy.engine.Connection): Open connection inside a transaction.
+        df (pd.DataFrame): Data to persist.
+    """
+    _SQLITE_TABLE.drop(conn, checkfirst=True)
+    _SQLITE_TABLE.create(conn)
+
+    columns = list(_SQL_DTYPES)
+    placeholders = ", ".join(["?"] * len(columns))
+    conn.exec_driver_sql(
+        f"INSERT INTO {TARGET_TABLE} ({', '.join(columns)}) VALUES ({placeholders})",
+        list(df[columns].itertuples(index=False, name=None)),
+    )
+
+
+def _upsert_values(conn, df: pd.DataFrame) -> None:
+    """
+    Upserts a small batch with a single `INSERT ... VALUES ... ON CONFLICT`.
+
+    Skips the staging table round-trips (create, populate, merge) which dominate
+    the cost for a leaderboard-sized batch.
+
+    Args:
+        conn (sqlalchemy.engine.Connection): Open connection inside a transaction.
+        df (pd.DataFrame): Data to upsert.
+    """
+    columns = ", ".join(UPSERT_COLUMNS)
+    placeholders = ", ".join(["%s"] * len(UPSERT_COLUMNS))
+    query = (
+        f"INSERT INTO {TARGET_TABLE} ({columns}, updated_at) VALUES %s"
+        f"{_UPSERT_CONFLICT_CLAUSE}"
+    )
+
+    cursor = conn.connection.cursor()
+    try:
+        execute_values(
+            cursor,
+            query,
+            df[list(UPSERT_COLUMNS)].itertuples(index=False, name=None),
+            template=f"({placeholders}, CURRENT_TIMESTAMP)",
+            page_size=1000,
+        )
+    finally:
+        cursor.close()
+
+
+def _upsert_via_staging(conn, df: pd.DataFrame) -> None:
+    """
+    Upserts a large batch through a persistent UNLOGGED staging table.
+
+    The staging table is created once and truncated per load, so repeated runs
+    skip CREATE/DROP DDL and WAL writes for the staged rows.
+
+    Args:
+        conn (sqlalchemy.engine.Connection): Open connection inside a transaction.
+        df (pd.DataFrame): Data to upsert.
+    """
+    conn.execute(
+        text(
+            f"CREATE UNLOGGED TABLE IF NOT EXISTS {STAGING_TABLE} "
+            f"(LIKE {TARGET_TABLE} INCLUDING DEFAULTS)"
+        )
+    )
+    # TRUNCATE also locks the staging table until commit, serializing loaders
+    conn.execute(text(f"TRUNCATE {STAGING_TABLE}"))
+    _copy_to_staging(conn, df[list(UPSERT_COLUMNS)], STAGING_TABLE)
+
+    # Execute Upsert (Idempotent Operation)
+    # Prepared once per pooled session (PREPARE is not undone by ROLLBACK), so
+    # later loads on the same connection skip parse + plan of the merge.
+    session_info = conn.connection.info
+    if not session_info.get(_UPSERT_STATEMENT):
+        columns = ", ".join(UPSERT_COLUMNS)
+        conn.execute(
+            text(
+                f"PREPARE {_UPSERT_STATEMENT} AS "
+                f"INSERT INTO {TARGET_TABLE} ({columns}, updated_at) "
+                f"SELECT {columns}, CURRENT_TIMESTAMP FROM {STAGING_TABLE}"
+                f"{_UPSERT_CONFLICT_CLAUSE}"
+            )
+        )
+        session_info[_UPSERT_STATEMENT] = True
+    conn.execute(text(f"EXECUTE {_UPSERT_STATEMENT}"))
 
 
 def load_data(df: pd.DataFrame) -> None:
@@ -37,58 +267,40 @@ def load_data(df: pd.DataFrame) -> None:
 
     Strategy:
         - SQLite: Full Replace (due to limited Upsert support).
-        - PostgreSQL: Atomic Upsert (INSERT ON CONFLICT UPDATE) via staging table.
+        - PostgreSQL: Atomic Upsert (INSERT ON CONFLICT UPDATE). Small batches are
+          sent as a single VALUES statement; larger ones go through an UNLOGGED
+          staging table populated with COPY.
 
     Args:
         df (pd.DataFrame): Cleaned data to persist.
+
+    Raises:
+        LoadError: If the database transaction fails.
     """
     if df.empty:
         logger.info("[Load] No records to load. Skipping.")
         return
 
-    engine = _get_engine()
-    target_table = "challenger_stats"
-    db_url = os.getenv("DB_URL", "")
+    engine = _get_engine(_DB_URL)
 
     try:
         # 1. SQLite: Simple Replace Strategy (Dev/Test)
-        if "sqlite" in db_url or not db_url:
+        if _IS_SQLITE:
             with engine.begin() as conn:
-                df.to_sql(target_table, con=conn, if_exists="replace", index=False)
-            logger.info(f"[Load] SQLite: Successfully loaded {len(df)} records.")
+                _replace_sqlite(conn, df)
+                conn.execute(text(_LP_INDEX_DDL))
+            logger.info("[Load] SQLite: Successfully loaded %d records.", len(df))
 
-        # 2. PostgreSQL: Staging Table + Upsert Strategy (Production)
+        # 2. PostgreSQL: Upsert Strategy (Production)
         else:
-            staging_table = "temp_challenger_stats"
             with engine.begin() as conn:
-                # Load to temporary staging table first
-                df.to_sql(staging_table, con=conn, if_exists="replace", index=False)
-
-                # Execute Upsert (Idempotent Operation)
-                upsert_query = text(
-                    f"""
-                    INSERT INTO {target_table}
-                        (player_name, summoner_id, lp, wins, losses, total_games, win_rate, updated_at)
-                    SELECT
-                        player_name, summoner_id, lp, wins, losses, total_games, win_rate, CURRENT_TIMESTAMP
-                    FROM {staging_table}
-                    ON CONFLICT (summoner_id)
-                    DO UPDATE SET
-                        lp = EXCLUDED.lp,
-                        wins = EXCLUDED.wins,
-                        losses = EXCLUDED.losses,
-                        total_games = EXCLUDED.total_games,
-                        win_rate = EXCLUDED.win_rate,
-                        updated_at = CURRENT_TIMESTAMP;
-                """
-                )
-                conn.execute(upsert_query)
-                conn.execute(text(f"DROP TABLE IF EXISTS {staging_table}"))
-
-            logger.info(f"[Load] PostgreSQL: Upsert completed for {len(df)} records.")
-
-    except SQLAlchemyError as e:
-        logger.critical(f"[Load] Database transaction failed: {e}")
-        raise
-    finally:
-        engine.dispose()
+                if len(df) < SMALL_BATCH_THRESHOLD:
+                    _upsert_values(conn, df)
+                else:
+                    _upsert_via_staging(conn, df)
+
+            logger.info("[Load] PostgreSQL: Upsert completed for %d records.", len(df))
+
+    except (SQLAlchemyError, psycopg2.Error) as e:
+        logger.critical("[Load] Database transaction failed: %s", e)
+        raise LoadError("DB_TRANSACTION_FAILED") from e
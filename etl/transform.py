@@ -5,13 +5,48 @@ Description:
     Ensures data quality (DQ) before loading into the production database.
 """
 import logging
+import os
 from typing import List, Optional
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+from etl import TransformError
 
 logger = logging.getLogger(__name__)
 
+# [Schema Mapping] Explicit API -> internal column mapping for standardization
+SCHEMA_MAP = {
+    "summonerName": "player_name",
+    "summonerId": "summoner_id",
+    "leaguePoints": "lp",
+    "wins": "wins",
+    "losses": "losses",
+}
+TARGET_COLUMNS = tuple(SCHEMA_MAP.values())
+# Values injected when the API drops a field entirely (identifiers stay strings
+# so the Parquet/DB column type remains VARCHAR)
+MISSING_FIELD_DEFAULTS = {
+    "player_name": "Unknown",
+    "summoner_id": "Unknown",
+    "lp": 0,
+    "wins": 0,
+    "losses": 0,
+}
+CRITICAL_FIELDS = ("player_name", "summoner_id", "lp")
+
+# Fixed schema of the API fields consumed by the pipeline (others are ignored)
+RAW_SCHEMA = pa.schema(
+    [
+        ("summonerName", pa.string()),
+        ("summonerId", pa.string()),
+        ("leaguePoints", pa.int32()),
+        ("wins", pa.int32()),
+        ("losses", pa.int32()),
+    ]
+)
+
 
 def validate_data(df: pd.DataFrame) -> bool:
     """
@@ -34,29 +69,29 @@ def validate_data(df: pd.DataFrame) -> bool:
 
     # 1. Business Logic Validation
     if "win_rate" in df.columns and "lp" in df.columns:
-        invalid_logic = df[(df["win_rate"] > 100) | (df["lp"] < 0)]
-        if not invalid_logic.empty:
-            logger.error(
-                f"[Validation] Logic violation detected in {len(invalid_logic)} rows."
-            )
+        # Single boolean pass over raw arrays; no filtered row copy is built
+        win_rate = df["win_rate"].to_numpy(dtype=np.float64, na_value=np.nan)
+        lp = df["lp"].to_numpy(dtype=np.float64, na_value=np.nan)
+        n_invalid = np.count_nonzero((win_rate > 100) | (lp < 0))
+        if n_invalid:
+            logger.error("[Validation] Logic violation detected in %d rows.", n_invalid)
             return False
 
     # 2. Schema Integrity & Null Checks
-    critical_fields = ["player_name", "summoner_id", "lp"]
-
     # [Defensive] Check if critical columns exist before accessing them
-    missing_cols = [col for col in critical_fields if col not in df.columns]
+    missing_cols = [col for col in CRITICAL_FIELDS if col not in df.columns]
     if missing_cols:
         logger.error(
-            f"[Validation] Critical schema drift detected. Missing: {missing_cols}"
+            "[Validation] Critical schema drift detected. Missing: %s", missing_cols
         )
         return False
 
-    if df[critical_fields].isnull().any().any():
+    # Per-column check stops at the first null column without building a sub-frame
+    if any(df[col].isna().any() for col in CRITICAL_FIELDS):
         logger.error("[Validation] Null values found in critical identifier fields.")
         return False
 
-    logger.info(f"[Validation] DQ checks passed for {len(df)} records.")
+    logger.info("[Validation] DQ checks passed for %d records.", len(df))
     return True
 
 
@@ -73,54 +108,154 @@ def transform_data(raw_data: List[dict]) -> pd.DataFrame:
         raw_data (List[dict]): List of raw player dictionaries from API.
 
     Returns:
-        pd.DataFrame: A cleaned and sorted DataFrame ready for loading.
+        pd.DataFrame: A cleaned DataFrame ready for loading (API order).
 
     Raises:
-        ValueError: If input is empty or DQ checks fail.
+        TransformError: If input is empty, DQ checks fail or processing errors.
     """
     try:
         if not raw_data:
             logger.error("[Transform] Input payload is empty.")
-            raise ValueError("TRANSFORM_INPUT_EMPTY")
+            raise TransformError("TRANSFORM_INPUT_EMPTY")
 
-        df = pd.DataFrame(raw_data)
-        logger.info(f"[Transform] Processing {len(df)} raw records.")
+        # [Defensive] Handle Schema Drift (API changes)
+        # Only keys absent from every record get defaults; explicit nulls are
+        # kept so the DQ gate still rejects null identifiers
+        missing = [
+            api_key
+            for api_key in SCHEMA_MAP
+            if not any(api_key in record for record in raw_data)
+        ]
 
-        # [Schema Mapping] Define explicit mapping for internal standardization
-        schema_map = {
-            "summonerName": "player_name",
-            "summonerId": "summoner_id",
-            "leaguePoints": "lp",
-            "wins": "wins",
-            "losses": "losses",
-        }
+        # Columnar build with known types (no per-value dtype inference)
+        table = pa.Table.from_pylist(raw_data, schema=RAW_SCHEMA)
+        logger.info("[Transform] Processing %d raw records.", table.num_rows)
+        df = table.rename_columns(
+            [SCHEMA_MAP[name] for name in table.column_names]
+        ).to_pandas()
 
-        # [Defensive] Handle Schema Drift (API changes)
-        for api_key, internal_name in schema_map.items():
-            if api_key not in df.columns:
-                logger.warning(
-                    f"[Transform] Schema mismatch: '{api_key}' missing. Filling default."
-                )
-                df[internal_name] = "Unknown" if "name" in internal_name else 0
-            else:
-                df.rename(columns={api_key: internal_name}, inplace=True)
+        for api_key in missing:
+            internal_name = SCHEMA_MAP[api_key]
+            logger.warning(
+                "[Transform] Schema mismatch: '%s' missing. Filling default.", api_key
+            )
+            df[internal_name] = MISSING_FIELD_DEFAULTS[internal_name]
 
         # Feature Selection & Engineering
-        df = df[list(schema_map.values())]
-        df["total_games"] = df["wins"] + df["losses"]
+        df = df[list(TARGET_COLUMNS)]
+
+        # Game counts dropped from individual records count as 0 games
+        # (same default as a field missing from the whole payload)
+        df = df.fillna({"wins": 0, "losses": 0})
+        wins = df["wins"].to_numpy()
+        total_games = wins + df["losses"].to_numpy()
 
         # Calculate Win Rate (Handle division by zero)
-        df["win_rate"] = np.where(
-            df["total_games"] > 0, (df["wins"] / df["total_games"] * 100).round(2), 0.0
-        )
+        # Divide only where games were played, in place into one preallocated buffer
+        win_rate = np.zeros(len(df), dtype=np.float64)
+        np.divide(wins, total_games, out=win_rate, where=total_games > 0)
+        win_rate *= 100.0
+        np.round(win_rate, 2, out=win_rate)
 
-        # Final DQ Gate
+        df["total_games"] = total_games
+        df["win_rate"] = win_rate
+
+        # Final DQ Gate (on the uncast frame, so a null lp is rejected here
+        # instead of failing the integer cast below)
         if not validate_data(df):
             logger.error("[Transform] Data Validation failed. Pipeline aborted.")
-            raise ValueError("DATA_QUALITY_FAILURE")
+            raise TransformError("DATA_QUALITY_FAILURE")
+
+        # [Performance] Downcast integer counts to halve bytes moved to the DB driver;
+        # win_rate stays float64 so its 2-decimal rounding survives to the DB
+        df = df.astype(
+            {
+                "lp": "int32",
+                "wins": "int32",
+                "losses": "int32",
+                "total_games": "int32",
+            }
+        )
 
-        return df.sort_values(by="lp", ascending=False).reset_index(drop=True)
+        # Ordering is left to consumers (challenger_stats is indexed on lp DESC)
+        return df
 
     except Exception as e:
-        logger.error(f"[Transform] Internal error: {str(e)}", exc_info=True)
-        raise
+        logger.error("[Transform] Internal error: %s", e, exc_info=True)
+        if isinstance(e, TransformError):
+            raise
+        raise TransformError("TRANSFORM_FAILED") from e
+
+
+def save_processed_data(df: pd.DataFrame, output_path: str) -> None:
+    """
+    Persists the transformed DataFrame as a columnar Parquet file.
+
+    Derived metrics (win_rate, total_games) are stored alongside the raw counts so
+    consumers such as the dashboard can project columns without recomputation.
+
+    Args:
+        df (pd.DataFrame): Output of `transform_data`.
+        output_path (str): Destination path of the Parquet file.
+
+    Raises:
+        TransformError: If the file cannot be written.
+    """
+    try:
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        df.to_parquet(output_path, engine="pyarrow", compression="zstd", index=False)
+    except (OSError, pa.ArrowException) as e:
+        logger.error(
+            "[Transform] Cannot write processed data to %s: %s", output_path, e
+        )
+        raise TransformError("PROCESSED_DATA_WRITE_FAILED") from e
+
+    logger.info("[Transform] Saved %d records to %s.", len(df), output_path)
+
+
+def publish_processed_data(staged_path: str, output_path: str) -> None:
+    """
+    Atomically replaces the processed file with a staged copy.
+
+    Lets the pipeline write the snapshot early but expose it only after the
+    database load succeeded, so the file never runs ahead of the database.
+
+    Args:
+        staged_path (str): File written by `save_processed_data`.
+        output_path (str): Final path read by the dashboard and skipped runs.
+
+    Raises:
+        TransformError: If the file cannot be moved into place.
+    """
+    try:
+        os.replace(staged_path, output_path)
+    except OSError as e:
+        logger.error(
+            "[Transform] Cannot publish processed data to %s: %s", output_path, e
+        )
+        raise TransformError("PROCESSED_DATA_WRITE_FAILED") from e
+
+
+def load_processed_data(input_path: str) -> pd.DataFrame:
+    """
+    Reads a DataFrame previously written by `save_processed_data`.
+
+    Used when the Transform stage is skipped (see `ETL_SKIP_STAGES` in main.py).
+
+    Args:
+        input_path (str): Path of the Parquet file.
+
+    Returns:
+        pd.DataFrame: The processed data, in the same layout `transform_data` returns.
+
+    Raises:
+        TransformError: If the file cannot be read.
+    """
+    try:
+        df = pd.read_parquet(input_path, engine="pyarrow")
+    except (OSError, pa.ArrowException) as e:
+        logger.error("[Transform] Cannot read processed data at %s: %s", input_path, e)
+        raise TransformError("PROCESSED_DATA_MISSING") from e
+
+    logger.info("[Transform] Loaded %d records from %s.", len(df), input_path)
+    return df
@@ -6,17 +6,50 @@ Description:
     global exceptions and notifications.
 """
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from typing import FrozenSet
 
-from etl.extract import extract_data
+from etl import ExtractError, LoadError, TransformError
+from etl.extract import extract_data, load_cached_entries
 from etl.load import load_data
-from etl.transform import transform_data
+from etl.transform import (
+    load_processed_data,
+    publish_processed_data,
+    save_processed_data,
+    transform_data,
+)
 from utils.alert import send_slack_alert
+from utils.config import load_config
 from utils.logger import setup_logger
 
 # Initialize global logger
 logger = setup_logger()
 
+PIPELINE_STAGES = ("extract", "transform", "load")
+
+
+def get_skipped_stages() -> FrozenSet[str]:
+    """
+    Reads the stages to skip from `ETL_SKIP_STAGES` (e.g. "extract,transform").
+
+    Returns:
+        FrozenSet[str]: Known stage names to skip; unknown names are ignored.
+    """
+    requested = {
+        stage.strip().lower()
+        for stage in os.getenv("ETL_SKIP_STAGES", "").split(",")
+        if stage.strip()
+    }
+    unknown = requested.difference(PIPELINE_STAGES)
+    if unknown:
+        logger.warning(
+            "[Pipeline] Ignoring unknown ETL_SKIP_STAGES: %s", sorted(unknown)
+        )
+    return frozenset(requested.intersection(PIPELINE_STAGES))
+
 
 def run_pipeline() -> None:
     """
@@ -25,34 +58,74 @@ def run_pipeline() -> None:
     Flow:
         1. Extract: Fetch data from Riot API.
         2. Transform: Cleanse and engineer features.
-        3. Load: Persist data to the target database.
+        3. Load: Persist data to the target database. The Parquet snapshot is
+           written concurrently and published only after the load succeeds.
         4. Notify: Send execution status to Slack.
+
+    Stages listed in `ETL_SKIP_STAGES` are skipped for incremental runs: a
+    skipped Extract reuses the raw backup, a skipped Transform reuses the
+    processed Parquet file, and a skipped Load leaves the database untouched.
     """
     try:
+        config = load_config()
+        processed_path = config["path"]["processed_data"]
+        skip = get_skipped_stages()
         logger.info(">>> Pipeline Execution Started")
+        if skip:
+            logger.info("[Pipeline] Skipping stages: %s", ", ".join(sorted(skip)))
         send_slack_alert("🚀 ETL Pipeline Started", level="INFO")
 
-        # [Step 1] Extraction
-        raw_data = extract_data()
+        if "transform" in skip:
+            # Extract only feeds Transform, so it is not needed either
+            clean_df = load_processed_data(processed_path)
+        else:
+            # [Step 1] Extraction
+            raw_data = load_cached_entries() if "extract" in skip else extract_data()
 
-        # [Step 2] Transformation
-        clean_df = transform_data(raw_data)
+            # [Step 2] Transformation
+            clean_df = transform_data(raw_data)
 
         # [Step 3] Loading
-        load_data(clean_df)
+        # The Parquet snapshot is written to a staging path while the DB load
+        # proceeds; it replaces the processed file only once the load succeeded,
+        # so the snapshot never runs ahead of the database
+        staged_path = f"{processed_path}.tmp"
+        try:
+            with ThreadPoolExecutor(max_workers=1) as io_pool:
+                save_future = None
+                if "transform" not in skip:
+                    save_future = io_pool.submit(
+                        save_processed_data, clean_df, staged_path
+                    )
+                if "load" not in skip:
+                    load_data(clean_df)
+                if save_future is not None:
+                    save_future.result()
+                    publish_processed_data(staged_path, processed_path)
+        finally:
+            with suppress(FileNotFoundError):
+                os.remove(staged_path)
 
         # [Completion]
         success_msg = f"✅ Pipeline Succeeded. Processed {len(clean_df)} records."
         logger.info(success_msg)
         send_slack_alert(success_msg, level="INFO")
 
-    except Exception as e:
-        # [Error Handling] Catch-all for unexpected failures
+    except (ExtractError, TransformError, LoadError) as e:
+        # [Error Handling] Fail-fast on a stage failure; the chained cause keeps
+        # the original traceback in the log
         error_msg = f"❌ Pipeline Failed: {type(e).__name__} - {str(e)}"
         logger.critical(error_msg, exc_info=True)
         send_slack_alert(error_msg, level="ERROR")
         sys.exit(1)
 
+    except Exception as e:
+        # [Error Handling] Catch-all for unexpected failures outside the stages
+        error_msg = f"🔥 Pipeline Crashed: {type(e).__name__} - {str(e)}"
+        logger.critical(error_msg, exc_info=True)
+        send_slack_alert(error_msg, level="CRITICAL")
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     run_pipeline()
@@ -0,0 +1,17 @@
+-- Schema setup for the PostgreSQL target of etl.load (run once per database).
+-- Applied automatically by docker-compose on first start of the db container;
+-- for an existing database run: psql "$DB_URL" -f sql/001_challenger_stats.sql
+
+CREATE TABLE IF NOT EXISTS challenger_stats (
+    player_name VARCHAR(64),
+    summoner_id VARCHAR(63) PRIMARY KEY,  -- ON CONFLICT target of the upsert
+    lp          INTEGER,
+    wins        INTEGER,
+    losses      INTEGER,
+    total_games INTEGER,
+    win_rate    DOUBLE PRECISION,
+    updated_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Serves "ORDER BY lp DESC" leaderboard reads; the ETL does not pre-sort rows
+CREATE INDEX IF NOT EXISTS challenger_stats_lp_desc ON challenger_stats (lp DESC);
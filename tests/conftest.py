@@ -0,0 +1,8 @@
+"""
+Module: tests/conftest.py
+Description: Shared pytest setup; makes the project root importable once per session.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
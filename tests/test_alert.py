@@ -0,0 +1,100 @@
+"""
+Module: tests/test_alert.py
+Description: Unit tests for batched Slack alert delivery.
+"""
+import http.server
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from utils import alert
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _avoid_minute_boundary():
+    """Alerts are grouped per minute; keep a test's alerts within one minute."""
+    if time.time() % 60 > 50:
+        time.sleep(61 - time.time() % 60)
+
+
+@pytest.fixture
+def webhook():
+    """Local HTTP stub standing in for the Slack webhook; yields (url, posts)."""
+    posts = []
+
+    class _Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            posts.append(json.loads(body))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/", posts
+    server.shutdown()
+    server.server_close()
+
+
+def test_alerts_are_batched(webhook, monkeypatch):
+    """Alerts are coalesced into posts of at most ALERT_BATCH_SIZE attachments."""
+    url, posts = webhook
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", url)
+    _avoid_minute_boundary()
+
+    for i in range(12):
+        alert.send_slack_alert(f"alert {i}", level="ERROR")
+    alert._shutdown_worker()
+
+    assert [len(post["attachments"]) for post in posts] == [10, 2]
+    texts = [a["text"] for post in posts for a in post["attachments"]]
+    assert texts == [f"alert {i}" for i in range(12)]
+
+
+def test_alerts_are_grouped_by_severity(webhook, monkeypatch):
+    """Each post carries a single severity, most severe group first."""
+    url, posts = webhook
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", url)
+    _avoid_minute_boundary()
+
+    alert.send_slack_alert("started", level="INFO")
+    alert.send_slack_alert("failed", level="CRITICAL")
+    alert.send_slack_alert("retrying", level="info")
+    alert._shutdown_worker()
+
+    assert [[a["text"] for a in post["attachments"]] for post in posts] == [
+        ["failed"],
+        ["started", "retrying"],
+    ]
+
+
+def test_pending_alerts_are_flushed_on_exit(webhook):
+    """Alerts queued right before sys.exit are still delivered."""
+    url, posts = webhook
+    _avoid_minute_boundary()
+    script = (
+        "import sys\n"
+        "from utils.alert import send_slack_alert\n"
+        "for i in range(12):\n"
+        "    send_slack_alert(f'alert {i}', level='ERROR')\n"
+        "sys.exit(1)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "SLACK_WEBHOOK_URL": url},
+        timeout=30,
+    )
+
+    assert result.returncode == 1
+    assert [len(post["attachments"]) for post in posts] == [10, 2]
@@ -3,19 +3,16 @@ Module: tests/test_config.py
 Description: Unit tests for configuration file structure.
 """
 import os
-import sys
 
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 try:
     from utils.config import load_config
 except ImportError:
     load_config = None
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
     """
     Project configuration fixture.
@@ -47,3 +44,24 @@ def test_path_configuration(config):
     assert isinstance(paths.get("raw_data"), str)
     assert isinstance(paths.get("processed_data"), str)
     assert isinstance(paths.get("db_path"), str)
+
+
+def test_load_config_reloads_on_change(tmp_path):
+    """Cached config is reused until the file is modified."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("path:\n  raw_data: a.json\n", encoding="utf-8")
+
+    first = load_config(str(config_file))
+    assert load_config(str(config_file)) is first
+
+    config_file.write_text("path:\n  raw_data: b.json\n", encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_config(str(config_file))["path"]["raw_data"] == "b.json"
+
+
+def test_load_config_missing_file(tmp_path):
+    """A missing config file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError, match="File not found"):
+        load_config(str(tmp_path / "missing.yaml"))
@@ -2,22 +2,16 @@
 Module: tests/test_data_quality.py
 Description: Unit tests for data validation logic.
 """
-import os
-import sys
-
 import pandas as pd
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from etl.transform import validate_data
-from utils.config import load_config
-
-
-@pytest.fixture
-def config():
-    """Load configuration for tests."""
-    return load_config()
+from etl import TransformError
+from etl.transform import (
+    load_processed_data,
+    save_processed_data,
+    transform_data,
+    validate_data,
+)
 
 
 @pytest.fixture
@@ -57,3 +51,120 @@ def test_empty_dataframe():
     """Test that empty DataFrame fails validation."""
     empty_df = pd.DataFrame()
     assert validate_data(empty_df) is False
+
+
+def test_save_processed_data_roundtrip(valid_dataframe, tmp_path):
+    """Test that processed data is persisted as Parquet with derived metrics."""
+    output_path = tmp_path / "processed" / "cleaned_data.parquet"
+    save_processed_data(valid_dataframe, str(output_path))
+
+    loaded = pd.read_parquet(output_path)
+    pd.testing.assert_frame_equal(loaded, valid_dataframe)
+
+
+def test_transform_data_fills_missing_fields():
+    """Test that fields dropped by the API are filled with defaults."""
+    raw_data = [
+        {"puuid": "p1", "leaguePoints": 1500, "wins": 30, "losses": 10},
+        {"puuid": "p2", "leaguePoints": 1700, "wins": 0, "losses": 0},
+    ]
+    df = transform_data(raw_data)
+
+    assert list(df["lp"]) == [1500, 1700]
+    assert (df["player_name"] == "Unknown").all()
+    assert (df["summoner_id"] == "Unknown").all()
+    assert list(df["total_games"]) == [40, 0]
+    assert list(df["win_rate"]) == [75.0, 0.0]
+
+
+def test_transform_data_empty_input_raises():
+    """Test that an empty payload fails the Transform stage with a typed error."""
+    with pytest.raises(TransformError, match="TRANSFORM_INPUT_EMPTY"):
+        transform_data([])
+
+
+def test_load_processed_data_missing_file(tmp_path):
+    """Test that reusing a missing processed file fails the Transform stage."""
+    with pytest.raises(TransformError, match="PROCESSED_DATA_MISSING"):
+        load_processed_data(str(tmp_path / "missing.parquet"))
+
+
+def test_transform_data_rejects_null_summoner_id():
+    """Test that an explicit null primary key is not masked by default filling."""
+    raw_data = [
+        {
+            "summonerName": "a",
+            "summonerId": None,
+            "leaguePoints": 1500,
+            "wins": 30,
+            "losses": 10,
+        },
+        {
+            "summonerName": "b",
+            "summonerId": None,
+            "leaguePoints": 1700,
+            "wins": 5,
+            "losses": 5,
+        },
+    ]
+    with pytest.raises(TransformError, match="DATA_QUALITY_FAILURE"):
+        transform_data(raw_data)
+
+
+def test_transform_data_keeps_rounded_win_rate():
+    """Test that win_rate keeps its 2-decimal rounding in the values sent to the DB."""
+    raw_data = [
+        {
+            "summonerName": "a",
+            "summonerId": "s1",
+            "leaguePoints": 1500,
+            "wins": 22,
+            "losses": 15,
+        },
+    ]
+    df = transform_data(raw_data)
+
+    row = next(df[["win_rate"]].itertuples(index=False, name=None))
+    assert row == (59.46,)
+
+
+def test_transform_data_rejects_null_league_points():
+    """Test that a null lp is rejected by the DQ gate, not by the integer cast."""
+    raw_data = [
+        {
+            "summonerName": "a",
+            "summonerId": "s1",
+            "leaguePoints": None,
+            "wins": 3,
+            "losses": 1,
+        },
+        {
+            "summonerName": "b",
+            "summonerId": "s2",
+            "leaguePoints": 1700,
+            "wins": 5,
+            "losses": 5,
+        },
+    ]
+    with pytest.raises(TransformError, match="DATA_QUALITY_FAILURE"):
+        transform_data(raw_data)
+
+
+def test_transform_data_record_missing_wins():
+    """Test that a record without wins is kept and counted as 0 wins."""
+    raw_data = [
+        {"summonerName": "a", "summonerId": "s1", "leaguePoints": 1500, "losses": 10},
+        {
+            "summonerName": "b",
+            "summonerId": "s2",
+            "leaguePoints": 1700,
+            "wins": 5,
+            "losses": 5,
+        },
+    ]
+    df = transform_data(raw_data)
+
+    assert list(df["wins"]) == [0, 5]
+    assert list(df["total_games"]) == [10, 10]
+    assert list(df["win_rate"]) == [0.0, 50.0]
+    assert df["wins"].dtype == "int32"
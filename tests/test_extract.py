@@ -0,0 +1,71 @@
+"""
+Module: tests/test_extract.py
+Description: Unit tests for extract-stage error handling.
+"""
+import pytest
+
+from etl import ExtractError, extract
+
+
+class _FakeResponse:
+    def __init__(self, status_code, content=b""):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, *args, **kwargs):
+        return self.response
+
+
+@pytest.fixture
+def fake_api(monkeypatch, tmp_path):
+    """Points the extract stage at a stubbed session and a temporary backup dir."""
+    monkeypatch.setattr(extract, "API_KEY", "test-key")
+    monkeypatch.setattr(extract, "RAW_BACKUP_PATH", str(tmp_path / "raw.json"))
+    monkeypatch.setattr(extract, "RAW_META_PATH", str(tmp_path / "raw.meta.json"))
+
+    def _respond(response):
+        monkeypatch.setattr(
+            extract, "_get_session", lambda *args: _FakeSession(response)
+        )
+
+    return _respond
+
+
+def test_not_modified_without_backup_raises(fake_api):
+    """A 304 with no usable raw backup is reported as an extract failure."""
+    fake_api(_FakeResponse(304))
+    with pytest.raises(ExtractError, match="RAW_BACKUP_MISSING"):
+        extract.extract_data()
+
+
+def test_malformed_response_raises(fake_api):
+    """An unparsable 200 body is reported as an extract failure."""
+    fake_api(_FakeResponse(200, b"{not json"))
+    with pytest.raises(ExtractError, match="API_RESPONSE_INVALID"):
+        extract.extract_data()
+
+
+def test_successful_fetch_projects_entries(fake_api):
+    """A 200 body is backed up and projected to the consumed fields."""
+    fake_api(
+        _FakeResponse(
+            200, b'{"entries": [{"summonerId": "s1", "wins": 1, "rank": "I"}]}'
+        )
+    )
+    assert extract.extract_data() == [{"summonerId": "s1", "wins": 1}]
+    assert extract.load_cached_entries() == [{"summonerId": "s1", "wins": 1}]
+
+
+def test_session_attempt_budget():
+    """`retries` counts every attempt, so urllib3 gets one retry fewer."""
+    retry = extract._get_session(3, 2).get_adapter("https://").max_retries
+    assert retry.total == 2
@@ -0,0 +1,84 @@
+"""
+Module: tests/test_load.py
+Description: Unit tests for the SQLite load path.
+"""
+import sqlite3
+
+import pytest
+
+from etl import load
+from etl.transform import transform_data
+
+
+@pytest.fixture
+def sqlite_url(monkeypatch, tmp_path):
+    """Points the load stage at a temporary file-backed SQLite database."""
+    db_path = tmp_path / "lol_data.db"
+    db_url = f"sqlite:///{db_path}"
+    monkeypatch.setattr(load, "_DB_URL", db_url)
+    monkeypatch.setattr(load, "_IS_SQLITE", True)
+    yield db_path
+    load._get_engine(db_url).dispose()
+
+
+@pytest.fixture
+def clean_df():
+    """A transformed two-player batch."""
+    raw_data = [
+        {
+            "summonerName": "Faker",
+            "summonerId": "s1",
+            "leaguePoints": 1500,
+            "wins": 22,
+            "losses": 15,
+        },
+        {
+            "summonerName": "Chovy",
+            "summonerId": "s2",
+            "leaguePoints": 1700,
+            "wins": 30,
+            "losses": 10,
+        },
+    ]
+    return transform_data(raw_data)
+
+
+def test_load_data_sqlite_replaces_table(sqlite_url, clean_df):
+    """Loading twice replaces the table with typed, rounded rows and the LP index."""
+    load.load_data(clean_df)
+    load.load_data(clean_df)
+
+    with sqlite3.connect(sqlite_url) as conn:
+        rows = conn.execute(
+            "SELECT player_name, summoner_id, lp, wins, losses, total_games, win_rate"
+            " FROM challenger_stats ORDER BY lp DESC"
+        ).fetchall()
+        column_types = {
+            name: col_type
+            for _, name, col_type, *_ in conn.execute(
+                "PRAGMA table_info(challenger_stats)"
+            )
+        }
+        indexes = {
+            name
+            for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert rows == [
+        ("Chovy", "s2", 1700, 30, 10, 40, 75.0),
+        ("Faker", "s1", 1500, 22, 15, 37, 59.46),
+    ]
+    assert column_types == {
+        "player_name": "VARCHAR(64)",
+        "summoner_id": "VARCHAR(63)",
+        "lp": "INTEGER",
+        "wins": "INTEGER",
+        "losses": "INTEGER",
+        "total_games": "INTEGER",
+        "win_rate": "FLOAT",
+    }
+    assert "challenger_stats_lp_desc" in indexes
+    assert journal_mode == "wal"
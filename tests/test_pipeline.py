@@ -0,0 +1,56 @@
+"""
+Module: tests/test_pipeline.py
+Description: Unit tests for the processed snapshot handling in run_pipeline.
+"""
+import pytest
+
+import main
+from etl import LoadError
+
+RAW_DATA = [
+    {
+        "summonerName": "Faker",
+        "summonerId": "s1",
+        "leaguePoints": 1500,
+        "wins": 30,
+        "losses": 10,
+    },
+]
+
+
+@pytest.fixture
+def pipeline(monkeypatch, tmp_path):
+    """Runs the pipeline offline; returns the processed snapshot path."""
+    processed_path = tmp_path / "processed" / "cleaned_data.parquet"
+    monkeypatch.setattr(
+        main, "load_config", lambda: {"path": {"processed_data": str(processed_path)}}
+    )
+    monkeypatch.setattr(main, "extract_data", lambda: RAW_DATA)
+    monkeypatch.setattr(main, "send_slack_alert", lambda *args, **kwargs: None)
+    monkeypatch.delenv("ETL_SKIP_STAGES", raising=False)
+    return processed_path
+
+
+def test_snapshot_published_after_load(pipeline, monkeypatch):
+    """The processed snapshot is published once the load succeeds."""
+    monkeypatch.setattr(main, "load_data", lambda df: None)
+
+    main.run_pipeline()
+
+    assert pipeline.exists()
+    assert not pipeline.with_name(pipeline.name + ".tmp").exists()
+
+
+def test_snapshot_not_published_when_load_fails(pipeline, monkeypatch):
+    """A failed load leaves no processed snapshot ahead of the database."""
+
+    def _fail(df):
+        raise LoadError("DB_TRANSACTION_FAILED")
+
+    monkeypatch.setattr(main, "load_data", _fail)
+
+    with pytest.raises(SystemExit):
+        main.run_pipeline()
+
+    assert not pipeline.exists()
+    assert not pipeline.with_name(pipeline.name + ".tmp").exists()
@@ -4,85 +4,245 @@ Provides real-time monitoring alerts using Slack Webhooks.
 Designed to deliver structured incident reports to the engineering team.
 """
 
-import json
-import os
+import atexit
 import logging
-from datetime import datetime
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-def send_slack_alert(message: str, level: str = "INFO") -> None:
+# Alerts are batched by a background worker; each batch is posted as one
+# webhook message per (severity, minute) group
+ALERT_BATCH_SIZE = 10
+ALERT_FLUSH_INTERVAL = 2.0  # seconds a batch may wait for more alerts
+
+ALERT_POST_TIMEOUT = 5  # seconds, applied to connect and to read separately
+ALERT_RETRIES = 2
+ALERT_RETRY_BACKOFF = 0.2
+# Worst case for one post: every attempt hits both timeouts, plus urllib3's
+# backoff sleeps (none after the first error, then backoff * 2 ** (n - 1))
+_MAX_POST_SECONDS = 2 * ALERT_POST_TIMEOUT * (ALERT_RETRIES + 1) + sum(
+    ALERT_RETRY_BACKOFF * 2 ** (n - 1) for n in range(2, ALERT_RETRIES + 1)
+)
+# At exit the worker may be mid-post; the final flush then sends the most
+# severe group first, so two worst-case posts cover the failure alert
+ALERT_SHUTDOWN_TIMEOUT = 2 * _MAX_POST_SECONDS
+
+_STOP = object()
+_alert_queue: "queue.Queue[Any]" = queue.Queue()
+_worker_lock = threading.Lock()
+_worker: Optional[threading.Thread] = None
+
+# Keep-alive connection reused by every webhook post; transient Slack errors
+# (rate limit / 5xx) are retried by urllib3, honoring Retry-After
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=ALERT_RETRIES,
+            backoff_factor=ALERT_RETRY_BACKOFF,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# Visual Styling: 등급별 시각적 요소(색상, 이모지) 정의
+# 실무에서는 색상만으로도 상황의 위급함을 즉시 인지할 수 있어야 합니다.
+SEVERITY_MAP = {
+    "INFO": {"color": "#36a64f", "emoji": "✅", "title": "System Normal"},
+    "WARNING": {"color": "#FFCC00", "emoji": "⚠️", "title": "System Warning"},
+    "ERROR": {"color": "#FF0000", "emoji": "🚨", "title": "System Error"},
+    "CRITICAL": {"color": "#800000", "emoji": "🔥", "title": "Critical Failure"},
+}
+# Attachment parts that never change between alerts (shared, read-only)
+_PRETEXT = {
+    severity: f"{style['emoji']} *LoL Pipeline Monitoring*"
+    for severity, style in SEVERITY_MAP.items()
+}
+_ENVIRONMENT_FIELD = {"title": "Environment", "value": "Production", "short": True}
+_FOOTER = "ETL-Bot-v1.0"
+# Flush order of severity groups (most severe first)
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(SEVERITY_MAP)}
+
+
+def _resolve_severity(level: str) -> str:
+    """Maps a level name to a SEVERITY_MAP key (unknown levels fall back to INFO)."""
+    return level.upper() if level.upper() in SEVERITY_MAP else "INFO"
+
+
+def _build_attachment(message: str, level: str) -> Dict[str, Any]:
     """
-    파이프라인의 실행 상태나 장애 내역을 Slack 채널로 전송합니다.
-    
+    단일 알림을 Slack 'Attachment' 블록으로 구성합니다.
+
     Args:
         message (str): 알림 본문 내용
         level (str): 알림의 심각도 수준 (INFO, WARNING, ERROR, CRITICAL)
-    """
-    
-    # 1. Configuration: 환경 변수에서 Webhook URL 보안 로드
-    webhook_url = os.getenv("SLACK_WEBHOOK_URL")
-    
-    if not webhook_url:
-        logger.warning("[Alert] SLACK_WEBHOOK_URL is missing. Skipping notification.")
-        return
 
-    # 2. Visual Styling: 등급별 시각적 요소(색상, 이모지) 정의
-    # 실무에서는 색상만으로도 상황의 위급함을 즉시 인지할 수 있어야 합니다.
-    severity_map = {
-        "INFO": {"color": "#36a64f", "emoji": "✅", "title": "System Normal"},
-        "WARNING": {"color": "#FFCC00", "emoji": "⚠️", "title": "System Warning"},
-        "ERROR": {"color": "#FF0000", "emoji": "🚨", "title": "System Error"},
-        "CRITICAL": {"color": "#800000", "emoji": "🔥", "title": "Critical Failure"}
-    }
-    
-    config = severity_map.get(level.upper(), severity_map["INFO"])
+    Returns:
+        dict: Slack attachment
+    """
+    # 2. Visual Styling: 등급별 시각적 요소(색상, 이모지) 조회
+    severity = _resolve_severity(level)
+    config = SEVERITY_MAP[severity]
+    # One clock read: epoch seconds for `ts`, local time for the readable field
+    now = time.time()
 
     # 3. Payload Construction: Slack 'Attachments' 레이아웃 구성
     # 단순 텍스트보다 필드 형식을 사용하면 로그 데이터 등을 깔끔하게 보여줄 수 있습니다.
-    payload = {
-        "attachments": [
+    return {
+        "fallback": f"[{level}] {message}",
+        "color": config["color"],
+        "pretext": _PRETEXT[severity],
+        "title": config["title"],
+        "text": message,
+        "fields": [
+            _ENVIRONMENT_FIELD,
             {
-                "fallback": f"[{level}] {message}",
-                "color": config["color"],
-                "pretext": f"{config['emoji']} *LoL Pipeline Monitoring*",
-                "title": config["title"],
-                "text": message,
-                "fields": [
-                    {
-                        "title": "Environment",
-                        "value": "Production",
-                        "short": True
-                    },
-                    {
-                        "title": "Timestamp",
-                        "value": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        "short": True
-                    }
-                ],
-                "footer": "ETL-Bot-v1.0",
-                "ts": int(datetime.now().timestamp())
+                "title": "Timestamp",
+                "value": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+                "short": True
             }
-        ]
+        ],
+        "footer": _FOOTER,
+        "ts": int(now)
     }
 
+
+def _post_attachments(webhook_url: str, attachments: List[Dict[str, Any]]) -> None:
+    """
+    여러 알림을 하나의 Slack 메시지로 묶어 전송합니다.
+
+    Args:
+        webhook_url (str): Slack Incoming Webhook URL
+        attachments (list): `_build_attachment`로 만든 블록 목록
+    """
     # 4. Transmission: HTTP POST 요청을 통한 메시지 발송
     try:
-        response = requests.post(
+        response = _SESSION.post(
             webhook_url,
-            data=json.dumps(payload),
+            data=orjson.dumps({"attachments": attachments}),
             headers={"Content-Type": "application/json"},
-            timeout=5 # 알림 전송 지연이 전체 파이프라인에 영향을 주지 않도록 짧은 타임아웃 설정
+            timeout=ALERT_POST_TIMEOUT # 알림 전송 지연이 전체 파이프라인에 영향을 주지 않도록 짧은 타임아웃 설정
         )
 
         if response.status_code != 200:
-            logger.error(f"[Alert] Slack API returned error: {response.status_code} - {response.text}")
-        else:
-            logger.debug(f"[Alert] Notification sent successfully (Level: {level})")
+            logger.error(
+                "[Alert] Slack API returned error: %s - %s",
+                response.status_code,
+                response.text,
+            )
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[Alert] Notification sent successfully (%d alerts)", len(attachments)
+            )
 
     except requests.exceptions.RequestException as e:
         # 알림 전송 실패가 메인 로직을 중단시켜서는 안 되므로 에러 로깅 후 통과
-        logger.error(f"[Alert] Failed to connect to Slack Webhook: {str(e)}")
\ No newline at end of file
+        logger.error("[Alert] Failed to connect to Slack Webhook: %s", e)
+
+
+def _flush_batch(batch: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+    """
+    Posts a batch of (webhook_url, severity, attachment) items.
+
+    Alerts are coalesced per (webhook_url, severity, minute) so one message never
+    mixes severities; groups are posted most severe first so failure alerts are
+    not queued behind routine ones.
+    """
+    groups: Dict[Tuple[str, str, int], List[Dict[str, Any]]] = {}
+    for webhook_url, severity, attachment in batch:
+        key = (webhook_url, severity, attachment["ts"] // 60)
+        groups.setdefault(key, []).append(attachment)
+
+    # sorted() is stable: within a severity, minutes keep their arrival order
+    for key in sorted(groups, key=lambda k: -_SEVERITY_RANK[k[1]]):
+        _post_attachments(key[0], groups[key])
+
+
+def _alert_worker() -> None:
+    """
+    Drains the alert queue, flushing when a batch is full or has waited
+    `ALERT_FLUSH_INTERVAL` seconds. Exits after flushing on the stop sentinel.
+    """
+    stopping = False
+    while not stopping:
+        item = _alert_queue.get()
+        if item is _STOP:
+            return
+
+        batch = [item]
+        deadline = time.monotonic() + ALERT_FLUSH_INTERVAL
+        while len(batch) < ALERT_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _alert_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                stopping = True
+                break
+            batch.append(item)
+
+        _flush_batch(batch)
+
+
+def _ensure_worker() -> None:
+    """Starts the background alert worker on first use."""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_alert_worker, name="slack-alert-worker", daemon=True
+            )
+            _worker.start()
+
+
+@atexit.register
+def _shutdown_worker() -> None:
+    """Delivers alerts still queued at interpreter exit (e.g. after sys.exit)."""
+    with _worker_lock:
+        worker = _worker
+    if worker is None or not worker.is_alive():
+        return
+    _alert_queue.put(_STOP)
+    worker.join(ALERT_SHUTDOWN_TIMEOUT)
+
+
+def send_slack_alert(message: str, level: str = "INFO") -> None:
+    """
+    파이프라인의 실행 상태나 장애 내역을 Slack 채널로 전송합니다.
+
+    호출 스레드를 막지 않도록 알림은 큐에 적재되고, 백그라운드 워커가
+    배치 단위로 묶어 전송합니다. 남은 알림은 프로세스 종료 시 전송됩니다.
+
+    Args:
+        message (str): 알림 본문 내용
+        level (str): 알림의 심각도 수준 (INFO, WARNING, ERROR, CRITICAL)
+    """
+
+    # 1. Configuration: 환경 변수에서 Webhook URL 보안 로드
+    webhook_url = os.getenv("SLACK_WEBHOOK_URL")
+
+    if not webhook_url:
+        logger.warning("[Alert] SLACK_WEBHOOK_URL is missing. Skipping notification.")
+        return
+
+    _ensure_worker()
+    attachment = _build_attachment(message, level)
+    _alert_queue.put_nowait((webhook_url, _resolve_severity(level), attachment))
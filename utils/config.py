@@ -5,15 +5,38 @@ Description:
     Ensures path resolution is robust across different execution environments.
 """
 import os
+from functools import lru_cache
 from typing import Any, Dict
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it (pure-Python fallback otherwise)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=4)
+def _parse_config(full_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parses a YAML file once per (path, modification time).
+
+    Args:
+        full_path (str): Absolute path to the config file.
+        mtime_ns (int): File modification time; part of the cache key only.
+
+    Returns:
+        dict: Parsed configuration dictionary.
+    """
+    with open(full_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
 
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     """
     Parses the YAML configuration file.
 
+    The parsed result is cached until the file's mtime changes, so repeated
+    calls return the same (shared, not to be mutated) dictionary.
+
     Args:
         config_path (str): Relative path to the config file.
 
@@ -27,8 +50,11 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     full_path = os.path.join(base_path, config_path)
 
-    if not os.path.exists(full_path):
-        raise FileNotFoundError(f"[Config] File not found at: {full_path}")
+    # EAFP: a single stat both checks existence and yields the cache key
+    try:
+        mtime_ns = os.stat(full_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"[Config] File not found at: {full_path}") from None
+
+    return _parse_config(full_path, mtime_ns)
 
-    with open(full_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
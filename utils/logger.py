@@ -1,12 +1,15 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 def setup_logger():
     """
     프로젝트 전체에서 사용할 로거(Logger)를 설정합니다.
     로그는 콘솔(화면)에도 나오고, 파일(pipeline.log)로도 저장됩니다.
+    실제 출력은 QueueListener 스레드가 담당하므로 로그 호출이 디스크 I/O를 기다리지 않습니다.
     """
     # 1. 로거 생성
     logger = logging.getLogger("LoL_Pipeline")
@@ -22,16 +25,30 @@ def setup_logger():
     # 3. 콘솔 핸들러 (화면에 출력)
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
 
     # 4. 파일 핸들러 (로그 저장)
     if not os.path.exists("logs"):
         os.makedirs("logs")
 
+    # delay=True: 첫 기록 시점에 파일을 엽니다
     file_handler = RotatingFileHandler(
-        "logs/pipeline.log", maxBytes=1024 * 1024 * 5, backupCount=5, encoding="utf-8"
+        "logs/pipeline.log",
+        maxBytes=1024 * 1024 * 5,
+        backupCount=5,
+        encoding="utf-8",
+        delay=True,
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # 5. 큐 핸들러 (로거는 큐에 적재만 하고, 리스너 스레드가 콘솔/파일에 기록)
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(
+        log_queue, stream_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    # 종료 시 큐에 남은 로그를 모두 기록한 뒤 리스너를 정리
+    atexit.register(listener.stop)
 
     return logger